@@ -130,6 +130,13 @@ TELEGRAM_CHAT_ID = get_config_value("TELEGRAM_CHAT_ID")
 # Default directory for storing screenshots
 SCREENSHOT_DIR = get_config_value("FUSIONSOLAR_SCREENSHOT_DIR", "/tmp/fusionsolar_management/screenshots")
 
+# Screenshot verbosity during browser automation
+# Options: "none", "errors", "key" or "all"
+SCREENSHOT_LEVEL = get_config_value("FUSIONSOLAR_SCREENSHOT_LEVEL", "errors")
+
+# Local file caching the FusionSolar browser authentication state between runs
+BROWSER_STATE_PATH = get_config_value("FUSIONSOLAR_BROWSER_STATE_PATH", "/tmp/fusionsolar_management/auth.json")
+
 # Directory for storing price history
 LOCAL_STORAGE_DIR = get_config_value("FUSIONSOLAR_PRICE_STORAGE_DIR", "/tmp/fusionsolar_management/prices") 
 
@@ -9,10 +9,11 @@ adjusts the power limit on a Huawei FusionSolar SmartLogger based on price thres
 """
 
 import datetime
+import functools
 from storage_interface import StorageInterface, create_storage
 import logging
 import sys
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from telegram_notifier import TelegramNotifier
@@ -26,7 +27,8 @@ from config import (
     LOCATION_LATITUDE,
     LOCATION_LONGITUDE,
     LOCATION_NAME,
-    LOCATION_COUNTRY
+    LOCATION_COUNTRY,
+    SCREENSHOT_LEVEL
 )
 
 # Configure logging
@@ -61,6 +63,25 @@ class PriceData:
         """Sort entries by time after initialization"""
         self.entries.sort(key=lambda entry: entry.time)
 
+    @classmethod
+    def from_arrays(cls, times: Sequence[datetime.datetime], prices: Sequence[float],
+                    fetch_time: datetime.datetime) -> 'PriceData':
+        """
+        Create price data from parallel sequences of times and prices.
+        
+        Args:
+            times (Sequence[datetime.datetime]): The start time of each entry
+            prices (Sequence[float]): The price of each entry in EUR/MWh, in the same order as times
+            fetch_time (datetime.datetime): When the prices were fetched
+            
+        Returns:
+            PriceData: The price data with one entry per time/price pair
+        """
+        if len(times) != len(prices):
+            raise ValueError(f"Got {len(times)} times but {len(prices)} prices")
+        return cls(entries=[PriceEntry(time=time, price=price) for time, price in zip(times, prices)],
+                   fetch_time=fetch_time)
+
     def get_date(self) -> datetime.datetime:
         """
         Get the date of the price entries.
@@ -412,15 +433,18 @@ def is_near_power_transition(price_data: PriceData, current_time: datetime.datet
     return False
 
 
-def is_daylight_with_times(current_time: datetime.datetime) -> dict:
+@functools.lru_cache(maxsize=8)
+def _sunrise_sunset_for_date(date: datetime.date) -> Tuple[datetime.datetime, datetime.datetime]:
     """
-    Check if the current time is between sunrise and sunset and return times.
+    Calculate the sunrise and sunset times at the configured location for a date.
+    
+    Results are cached, so repeated daylight checks on the same day skip the solar calculation.
     
     Args:
-        current_time (datetime.datetime): The current time to check
+        date (datetime.date): The date to calculate the solar times for
         
     Returns:
-        dict: Contains 'is_daylight' (bool), 'sunrise' (datetime), 'sunset' (datetime)
+        Tuple[datetime.datetime, datetime.datetime]: The sunrise and sunset times in TIMEZONE
     """
     from astral import LocationInfo
     from astral.sun import sun
@@ -434,11 +458,23 @@ def is_daylight_with_times(current_time: datetime.datetime) -> dict:
         longitude=LOCATION_LONGITUDE
     )
     
+    solar_times = sun(location.observer, date=date, tzinfo=TIMEZONE)
+    return solar_times['sunrise'], solar_times['sunset']
+
+
+def is_daylight_with_times(current_time: datetime.datetime) -> dict:
+    """
+    Check if the current time is between sunrise and sunset and return times.
+    
+    Args:
+        current_time (datetime.datetime): The current time to check
+        
+    Returns:
+        dict: Contains 'is_daylight' (bool), 'sunrise' (datetime), 'sunset' (datetime)
+    """
     # Get sunrise and sunset times for the current date
     current_date = current_time.date()
-    solar_times = sun(location.observer, date=current_date, tzinfo=TIMEZONE)
-    sunrise = solar_times['sunrise']
-    sunset = solar_times['sunset']
+    sunrise, sunset = _sunrise_sunset_for_date(current_date)
 
     is_day = sunrise <= current_time <= sunset
     logger.info(f"Solar times for {current_date}: sunrise={sunrise.strftime('%H:%M')}, sunset={sunset.strftime('%H:%M')}, is_daylight={is_day}")
@@ -450,19 +486,20 @@ def is_daylight_with_times(current_time: datetime.datetime) -> dict:
     }
 
 
-def main(force_notify: bool = False):
+def main(force_notify: bool = False, now: Optional[Callable[[], datetime.datetime]] = None):
     """
     Main function to orchestrate the price analysis and power setting.
 
     Args:
         force_notify: If True, always send failure notifications regardless of
                      power transition timing. Used for manual Lambda invocations.
+        now: Returns the current time. Defaults to the current time in TIMEZONE.
     """
     power_changed = False
     power_setting = None
     price_data = None
     storage = None
-    current_time = datetime.datetime.now(TIMEZONE)
+    current_time = now() if now is not None else datetime.datetime.now(TIMEZONE)
 
     try:
         logger.info("Starting electricity price analysis")
@@ -493,7 +530,7 @@ def main(force_notify: bool = False):
         # Apply the power setting
         logger.info(f"Setting power to {power_setting} kW")
         from set_power import SetPower, SetPowerError
-        power_setter = SetPower(FUSIONSOLAR_USERNAME, FUSIONSOLAR_PASSWORD, storage)
+        power_setter = SetPower(FUSIONSOLAR_USERNAME, FUSIONSOLAR_PASSWORD, storage, SCREENSHOT_LEVEL)
         result = power_setter.set_power_limit(power_setting)
 
         if result:
@@ -1,69 +1,104 @@
+from contextlib import contextmanager
 from typing import Optional
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, expect
 import time
 import logging
-import sys
 import os
 import datetime
 import tempfile
-from config import TIMEZONE
+from config import TIMEZONE, BROWSER_STATE_PATH
 from storage_interface import StorageInterface
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Logging handlers are configured by the application, not on import
 logger = logging.getLogger(__name__)
 
 # Default directory for storing screenshots is now imported from config.py
 
+# Screenshot verbosity levels, from least to most verbose. A screenshot tagged with
+# a given level is only captured when the configured level is at least as verbose.
+SCREENSHOT_LEVELS = ("none", "errors", "key", "all")
+
+# Reports which active power control mode options are currently visible, in a single DOM read.
+# Mirrors Playwright's visibility check: the element has a non-empty box and is not visibility:hidden.
+CONTROL_MODES_VISIBILITY_JS = """() => {
+    const isVisible = (selector) => {
+        const element = document.querySelector(selector);
+        return !!element && element.getClientRects().length > 0 && getComputedStyle(element).visibility !== 'hidden';
+    };
+    return {
+        limited: isVisible('span[title="Limited Power Grid (kW)"]'),
+        remote: isVisible('span[title="Remote communication scheduling"]'),
+        no_limit: isVisible('span[title="No limit"]'),
+    };
+}"""
+
+
 class Screenshotter:
 
-    def __init__(self, page, storage: StorageInterface):
+    def __init__(self, page, storage: StorageInterface, screenshot_level: str = "errors"):
         """
         Initialize the Screenshotter with a Playwright page and session path.
 
         Args:
             page: Playwright page object
             storage (StorageInterface): Storage interface to use for saving screenshots
+            screenshot_level (str): One of SCREENSHOT_LEVELS; screenshots tagged with a
+                more verbose level are skipped
         """
         self.page = page
+        self.screenshot_level = SCREENSHOT_LEVELS.index(screenshot_level)
         self.session_path = f"screenshots/session_{datetime.datetime.now(TIMEZONE).strftime('%Y-%m-%d_%H-%M')}"
         self.storage = storage
         self.stage_name = None  # Track the last successful screenshot action
         self.last_screenshot = None  # Track the last successful screenshot bytes
+        self.saved_count = 0  # Number of screenshots successfully written to storage
+        self.sequence = 0  # Number of screenshots attempted, used to order filenames
         logger.info("Screenshotter initialized")
 
-    def take_screenshot(self, action_name) -> Optional[bytes]:
+    def take_screenshot(self, action_name, level: str = "all") -> Optional[bytes]:
         """
         Take a screenshot of the current page state and save it using the storage interface.
 
+        The stage name is tracked even when the screenshot itself is skipped due to the
+        configured screenshot level, so failures can still report the last reached stage.
+
         Args:
             action_name (str): Name of the action being performed
+            level (str): Verbosity level of this screenshot (one of SCREENSHOT_LEVELS)
 
         Returns:
-            Optional[bytes]: The screenshot image data, or None if capture failed
+            Optional[bytes]: The screenshot image data, or None if skipped or capture failed
         """
+        if SCREENSHOT_LEVELS.index(level) > self.screenshot_level:
+            self.stage_name = action_name
+            return None
+
         try:
             time.sleep(1)  # Delay to ensure the page is fully loaded
-            # Create timestamp for the filename
-            timestamp = datetime.datetime.now(TIMEZONE).strftime("%Y-%m-%d_%H-%M-%S")
+            # Prefix the filename with a per-session sequence number; it keeps screenshots ordered
+            # and unique even when several are taken within the same second
+            self.sequence += 1
+            timestamp = f"{self.sequence:04d}_{int(time.time())}"
+
+            # Error-level screenshots are kept as evidence: full page, lossless PNG.
+            # Everything else only needs the current viewport as a (much smaller) JPEG.
+            evidence = level == "errors"
+            extension = "png" if evidence else "jpg"
 
             # Create a filename with timestamp and action name
-            filename = f"{timestamp}_{action_name}.png"
+            filename = f"{timestamp}_{action_name}.{extension}"
             filepath = os.path.join(self.session_path, filename)
 
             # Use a temporary file for the screenshot, then upload to storage
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
+            with tempfile.NamedTemporaryFile(suffix=f'.{extension}', delete=False) as tmp_file:
                 tmp_path = tmp_file.name
 
             # Take the screenshot to the temp file
-            self.page.screenshot(path=tmp_path, full_page=True)
+            if evidence:
+                self.page.screenshot(path=tmp_path, full_page=True, type='png')
+            else:
+                self.page.screenshot(path=tmp_path, full_page=False, type='jpeg', quality=70)
 
             # Read the screenshot data
             with open(tmp_path, 'rb') as f:
@@ -76,7 +111,9 @@ class Screenshotter:
             os.unlink(tmp_path)
 
             if success:
-                logger.info(f"Screenshot saved to storage: {filepath}")
+                self.saved_count += 1
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Screenshot saved to storage: {filepath}")
             else:
                 logger.error(f"Failed to save screenshot to storage: {filepath}")
 
@@ -89,6 +126,58 @@ class Screenshotter:
             return None
 
 
+class BrowserSession:
+    """
+    Context manager that opens a browser context, reusing the authentication state
+    (cookies and local storage) saved by a previous run if available.
+    """
+
+    def __init__(self, browser, state_path: str):
+        """
+        Initialize the BrowserSession.
+
+        Args:
+            browser: Launched Playwright browser
+            state_path (str): Local file path used to cache the authentication state
+        """
+        self.browser = browser
+        self.state_path = state_path
+        self.context = None
+
+    def __enter__(self) -> "BrowserSession":
+        storage_state = None
+        if os.path.isfile(self.state_path):
+            logger.info(f"Reusing cached authentication state from {self.state_path}")
+            storage_state = self.state_path
+        self.context = self.browser.new_context(storage_state=storage_state)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.context.close()
+
+    def new_page(self):
+        """
+        Open a new page in the session's browser context.
+
+        Returns:
+            Page: Playwright page object
+        """
+        return self.context.new_page()
+
+    def save_state(self) -> None:
+        """
+        Save the current authentication state so that subsequent sessions can skip login.
+        """
+        try:
+            # The state holds live session cookies, so keep it private to the current user
+            os.makedirs(os.path.dirname(self.state_path), mode=0o700, exist_ok=True)
+            self.context.storage_state(path=self.state_path)
+            os.chmod(self.state_path, 0o600)
+            logger.info(f"Saved authentication state to {self.state_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save authentication state to {self.state_path}: {e}")
+
+
 class SetPowerError(Exception):
     """Exception raised when setting power limit fails, optionally carrying a screenshot and stage name."""
 
@@ -101,9 +190,12 @@ class SetPowerError(Exception):
 class SetPower:
     """
     Class to handle power limit setting for Huawei FusionSolar SmartLogger device.
+
+    Each set_power_limit call launches and closes its own browser. Use the instance as
+    a context manager to keep a single browser running across multiple calls instead.
     """
     
-    def __init__(self, username, password, storage):
+    def __init__(self, username, password, storage, screenshot_level: str = "errors", debug: bool = False):
         """
         Initialize the SetPower class with login credentials.
         
@@ -111,11 +203,75 @@ class SetPower:
             username (str): FusionSolar username
             password (str): FusionSolar password
             storage (StorageInterface): Storage interface for saving screenshots
+            screenshot_level (str): Screenshot verbosity, one of "none", "errors", "key" or "all"
+            debug (bool): Slow down browser actions for debugging (not for production use)
         """
+        if screenshot_level not in SCREENSHOT_LEVELS:
+            raise ValueError(f"Invalid screenshot level '{screenshot_level}', expected one of {SCREENSHOT_LEVELS}")
         self.username = username
         self.password = password
         self.storage = storage
+        self.screenshot_level = screenshot_level
+        self.browser_state_path = BROWSER_STATE_PATH
+        self.debug = debug
+        self.playwright = None
+        self.browser = None
         logger.info("SetPower instance initialized")
+
+    def __enter__(self) -> "SetPower":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self) -> None:
+        """
+        Start Playwright and launch the browser used by subsequent set_power_limit calls.
+        """
+        logger.info("Initializing Playwright")
+        self.playwright = sync_playwright().start()
+        logger.info("Launching browser")
+        try:
+            self.browser = self.playwright.chromium.launch(
+                headless=True,
+                slow_mo=200 if self.debug else 0,
+                # /dev/shm is tiny in Lambda containers, so let Chromium use /tmp for shared memory
+                args=["--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox"]
+            )
+        except Exception:
+            # Stop Playwright so a later start() on this thread can start it again
+            self.close()
+            raise
+        logger.info("Browser launched successfully")
+
+    def close(self) -> None:
+        """
+        Close the browser and stop Playwright if they are running.
+        """
+        if self.browser is not None:
+            logger.info("Closing browser")
+            self.browser.close()
+            self.browser = None
+            logger.info("Browser closed")
+        if self.playwright is not None:
+            self.playwright.stop()
+            self.playwright = None
+
+    @contextmanager
+    def _session(self):
+        """
+        Open a BrowserSession, launching a browser just for this session if none is running.
+        """
+        owns_browser = self.browser is None
+        if owns_browser:
+            self.start()
+        try:
+            with BrowserSession(self.browser, self.browser_state_path) as session:
+                yield session
+        finally:
+            if owns_browser:
+                self.close()
     
     def set_power_limit(self, power_limit: str) -> bool:
         """
@@ -130,79 +286,96 @@ class SetPower:
         logger.info("Starting set_power_limit function")
         
 
-        with sync_playwright() as playwright:
-            logger.info("Initializing Playwright")
-            logger.info("Launching browser")
-            browser = playwright.chromium.launch(slow_mo=200, args=["--disable-gpu", "--single-process"])
-            logger.info("Browser launched successfully")
-
+        with self._session() as session:
+            failed_stage = None
             try:
                 # Create a new page
                 logger.info("Creating new page")
-                page = browser.new_page()
+                page = session.new_page()
                 logger.info("New page created")
 
                 # Set up a session directory for screenshots
-                screenshotter = Screenshotter(page, self.storage)
+                screenshotter = Screenshotter(page, self.storage, self.screenshot_level)
+
+                # After login, we land on the plant Overview page under Monitoring
+                # Device Management is in the secondary nav - click it directly
+                # Use a more specific selector to avoid matching hidden dropdown items
+                device_management_tab = page.locator('a:has-text("Device Management"):visible')
+                username_input = page.locator('input#username')
 
                 # Navigate to the login page
+                # With a still-valid cached session this redirects straight to the dashboard
                 logger.info("Navigating to login page")
                 page.goto('https://eu5.fusionsolar.huawei.com/unisso/login.action')
-                screenshotter.take_screenshot("login_page_loaded")
+                username_input.or_(device_management_tab).first.wait_for(state='visible')
+                screenshotter.take_screenshot("login_page_loaded", level="key")
                 logger.info("Login page loaded")
-                
-                # Fill in the username and password fields
-                logger.info("Filling username and password")
-                page.fill('input#username', self.username)
-                page.fill('input#value', self.password)
-                screenshotter.take_screenshot("credentials_filled")
-                logger.info("Username and password filled")
 
-                
-                # Click the login button
-                logger.info("Clicking login button")
-                page.click('span#submitDataverify')
-                screenshotter.take_screenshot("login_button_clicked")
-                logger.info("Login button clicked")
-                
-                # Wait for navigation to complete after login
-                logger.info("Waiting for navigation to complete")
-                page.wait_for_load_state('networkidle')
-                screenshotter.take_screenshot("login_completed")
-                logger.info("Navigation completed")
-                
-                # After login, we land on the plant Overview page under Monitoring
-                # Device Management is in the secondary nav - click it directly
-                # Use a more specific selector to avoid matching hidden dropdown items
+                if username_input.is_visible():
+                    # Fill in the username and password fields
+                    logger.info("Filling username and password")
+                    page.fill('input#username', self.username)
+                    page.fill('input#value', self.password)
+                    screenshotter.take_screenshot("credentials_filled", level="key")
+                    logger.info("Username and password filled")
+
+                    # Click the login button
+                    logger.info("Clicking login button")
+                    page.click('span#submitDataverify')
+                    screenshotter.take_screenshot("login_button_clicked", level="key")
+                    logger.info("Login button clicked")
+
+                    # Wait for navigation to complete after login
+                    # The dashboard keeps long-lived connections open, so 'networkidle' may never settle;
+                    # wait for the DOM and then for the element we interact with next instead.
+                    logger.info("Waiting for navigation to complete")
+                    page.wait_for_load_state('domcontentloaded')
+                    device_management_tab.wait_for(state='visible')
+                    screenshotter.take_screenshot("login_completed", level="key")
+                    logger.info("Navigation completed")
+
+                    session.save_state()
+                else:
+                    logger.info("Already logged in with cached authentication state, skipping login")
+
                 # Navigate to Device Management
                 logger.info("Clicking on Device Management tab")
-                page.locator('a:has-text("Device Management"):visible').click()
+                device_management_tab.click()
                 screenshotter.take_screenshot("device_management_clicked")
                 logger.info("Device Management tab clicked")
                 
                 # Find the SmartLogger row and select it
                 logger.info("Finding and selecting SmartLogger row")
-                page.locator('tr').filter(has_text='SmartLogger').locator('input.ant-checkbox-input').click()
+                page.locator('tr:has-text("SmartLogger") input.ant-checkbox-input').click()
                 screenshotter.take_screenshot("smartlogger_selected")
                 logger.info("SmartLogger row selected")
                 
                 # Open Set Parameters dialog
+                # The portal can render duplicate elements, so act on the first match like page.click does
                 logger.info("Clicking Set Parameters button")
-                page.click('button:has-text("Set Parameters")')
+                page.get_by_role("button", name="Set Parameters").first.click()
                 screenshotter.take_screenshot("set_parameters_clicked")
                 logger.info("Set Parameters button clicked")
                 
                 # Navigate to Active Power Control tab
                 # Wait for the tab to be visible (modal may still be loading)
                 logger.info("Waiting for Active Power Control tab to be visible")
-                page.wait_for_selector('text=Active Power Control', timeout=60000)
+                active_power_control_tab = page.locator('text=Active Power Control').first
+                active_power_control_tab.wait_for(timeout=60000)
                 logger.info("Clicking Active Power Control tab")
-                page.click('text=Active Power Control')
+                active_power_control_tab.click()
                 screenshotter.take_screenshot("active_power_control_tab")
                 logger.info("Active Power Control tab clicked")
 
+                # Wait for the tab content to render before checking which control mode is selected
+                page.locator('span[title="Limited Power Grid (kW)"]') \
+                    .or_(page.locator('span[title="Remote communication scheduling"]')) \
+                    .or_(page.locator('span[title="No limit"]')) \
+                    .first.wait_for(timeout=60000)
+                control_modes = page.evaluate(CONTROL_MODES_VISIBILITY_JS)
+
                 if power_limit == "no limit":
-                    if page.is_visible('span[title="Limited Power Grid (kW)"]'):
+                    if control_modes['limited']:
                         page.click('span[title="Limited Power Grid (kW)"]')
                         screenshotter.take_screenshot("limited_power_grid_clicked")
 
@@ -211,7 +384,7 @@ class SetPower:
                         page.click('div[title="No limit"]')
                         screenshotter.take_screenshot("no_limit_clicked")
                         logger.info("No limit field clicked")
-                    elif page.is_visible('span[title="Remote communication scheduling"]'):
+                    elif control_modes['remote']:
                         page.click('span[title="Remote communication scheduling"]')
                         screenshotter.take_screenshot("remote_communication_scheduling_clicked")
 
@@ -221,25 +394,25 @@ class SetPower:
                         screenshotter.take_screenshot("no_limit_clicked")
                         logger.info("No limit field clicked")
 
-                    elif page.is_visible('span[title="No limit"]'):
+                    elif control_modes['no_limit']:
                         logger.info("Power limit is set to 'No limit' already")
                         return False
                     screenshotter.take_screenshot("select_active_power_control_mode")
                 else:
                     # Check if Limited Power Grid field is already selected
                     logger.info("Checking if Limited Power Grid field is already selected")
-                    if page.is_visible('span[title="Limited Power Grid (kW)"]'):
+                    if control_modes['limited']:
                         logger.info("Limited Power Grid field is already selected")
                     else:
                         logger.info("Limited Power Grid field is not selected")
                         screenshotter.take_screenshot("limited_power_grid_not_selected")
-                        if page.is_visible('span[title="Remote communication scheduling"]'):
+                        if control_modes['remote']:
                             # Select Remote communication scheduling
                             logger.info("Selecting Remote communication scheduling")
                             page.click('span[title="Remote communication scheduling"]')
                             screenshotter.take_screenshot("remote_comm_scheduling_selected")
                             logger.info("Remote communication scheduling selected")
-                        elif page.is_visible('span[title="No limit"]'):
+                        elif control_modes['no_limit']:
                             # Select No limit
                             logger.info("Selecting No limit")
                             page.click('span[title="No limit"]')
@@ -254,56 +427,53 @@ class SetPower:
                         screenshotter.take_screenshot("limited_power_grid_clicked")
                         logger.info("Limited Power Grid field clicked")
 
+                    start_control_input = page.locator('div#signal-config-form-item-230200032 input')
+                    power_limit_input = page.locator('div#signal-config-form-item-21098 input')
+
                     # Set start active control
                     logger.info("Setting Start control field")
-                    page.locator('div#signal-config-form-item-230200032').locator('input').fill('Yes')
-                    page.locator('div#signal-config-form-item-230200032').locator('input').press('Enter')
+                    start_control_input.fill('Yes')
+                    start_control_input.press('Enter')
                     screenshotter.take_screenshot("set_start_control_input")
                     logger.info("Start control field set")
 
                     # Hover over input so it's scrolled into view
                     logger.info("Hovering over power limit input field")
-                    page.locator('div#signal-config-form-item-21098').locator('input').hover()
+                    power_limit_input.hover()
                     screenshotter.take_screenshot("hover_power_limit_input")
                     logger.info("Hovered over power limit input field")
 
                     # Set the power limit value
                     logger.info(f"Setting power limit to: {power_limit} kW")
-                    page.locator('div#signal-config-form-item-21098').locator('input').fill(power_limit)
+                    power_limit_input.fill(power_limit)
                     screenshotter.take_screenshot(f"power_limit_set_{power_limit}")
                     logger.info("Power limit value set")
                 
                 # Save the changes
-                if page.locator('button:has-text("Save")').is_enabled():
+                save_button = page.get_by_role("button", name="Save").first
+                if save_button.is_enabled():
                     logger.info("Clicking Save button")
-                    page.click('button:has-text("Save")')
-                    screenshotter.take_screenshot("save_button_clicked")
+                    save_button.click()
+                    screenshotter.take_screenshot("save_button_clicked", level="key")
                     logger.info("Save button clicked")
                 else:
                     logger.info("Save button is not enabled, skipping click")
-                    screenshotter.take_screenshot("save_button_not_enabled")
+                    screenshotter.take_screenshot("save_button_not_enabled", level="key")
                     return False
                 
                 # Wait for success message
                 logger.info("Waiting for success message")
-                success = False
-                timeout = 120
-                start_time = time.time()
-                
-                while time.time() - start_time < timeout:
-                    if page.locator('div.ant-modal-confirm-content').filter(has_text='Operation succeeded.').is_visible():
-                        success = True
-                        screenshotter.take_screenshot("operation_succeeded")
-                        logger.info("Operation succeeded!")
-                        break
-                    # Take a screenshot every 10 seconds while waiting
-                    if int(time.time() - start_time) % 10 == 0:
-                        screenshotter.take_screenshot(f"waiting_for_confirmation_{int(time.time() - start_time)}s")
-                    time.sleep(1)
-                    logger.info("Waiting for confirmation...")
-                
+                try:
+                    # Auto-retrying assertion; resolves as soon as the confirmation modal appears
+                    expect(page.locator('div.ant-modal-confirm-content').filter(has_text='Operation succeeded.')).to_be_visible(timeout=120_000)
+                    success = True
+                    screenshotter.take_screenshot("operation_succeeded", level="errors")
+                    logger.info("Operation succeeded!")
+                except AssertionError:
+                    success = False
+
                 if not success:
-                    screenshotter.take_screenshot("operation_timeout_or_failed")
+                    screenshotter.take_screenshot("operation_timeout_or_failed", level="errors")
                     logger.warning("Operation timed out or failed")
 
                 logger.info(f"Returning success status: {success}")
@@ -313,23 +483,22 @@ class SetPower:
                 logger.error(f"An error occurred: {e}")
                 # Capture the stage name before taking the error screenshot.
                 # (error screenshot would overwrite stage_name, but we want the last successful stage)
-                stage_name = screenshotter.stage_name
+                stage_name = failed_stage = screenshotter.stage_name
                 last_good_screenshot = screenshotter.last_screenshot
                 # Try to capture error state screenshot, fall back to last successful screenshot
                 error_screenshot = None
                 try:
-                    error_screenshot = screenshotter.take_screenshot("error_state")
+                    error_screenshot = screenshotter.take_screenshot("error_state", level="errors")
                 except Exception as capture_err:
                     logger.warning(f"Failed to capture error state screenshot: {capture_err}")
                 # Use error screenshot if available, otherwise fall back to last successful screenshot
                 screenshot_to_send = error_screenshot if error_screenshot else last_good_screenshot
                 raise SetPowerError(str(e), screenshot=screenshot_to_send, stage=stage_name) from e
             finally:
+                # Read the last stage before the final screenshot overwrites it
+                last_stage = failed_stage or screenshotter.stage_name
 
                 # Save final state screenshot
                 screenshotter.take_screenshot("final_state")
-
-                # Close the browser
-                logger.info("Closing browser")
-                browser.close()
-                logger.info("Browser closed")
+                logger.info(f"Session summary: last stage '{last_stage}', "
+                            f"{screenshotter.saved_count} screenshot(s) saved to {screenshotter.session_path}")
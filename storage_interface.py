@@ -7,10 +7,26 @@ Storage Interface for FusionSolar Power Adjustment
 This module provides an interface and implementations for different storage solutions.
 """
 
+import asyncio
+import io
 import logging
+import mimetypes
 import os
+import re
+import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterable, List, Optional
+
+import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError
+
 from config import STORAGE_TYPE, S3_BUCKET_NAME, S3_REGION, S3_ACCESS_KEY_ID, S3_SECRET_ACCESS_KEY, \
     LOCAL_STORAGE_DIR
 
@@ -22,6 +38,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Size of the S3 client's connection pool, which also bounds concurrent S3 requests from read_many
+S3_MAX_POOL_CONNECTIONS = 50
+
+# S3 uploads larger than this are sent as parallel multipart uploads
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+# Buffer size for local file copies when the kernel can't copy the file itself
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Number of characters encoded at a time when writing text to local files
+TEXT_WRITE_CHUNK_SIZE = 1024 * 1024
+
+# Buffer size of the file object local text files are written through
+TEXT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Maximum number of buffers a single os.writev call accepts
+IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+
+def _is_not_found(error: "ClientError") -> bool:
+    """
+    Check whether an S3 ClientError means that the requested key does not exist.
+    
+    Args:
+        error (ClientError): The error raised by the S3 client
+        
+    Returns:
+        bool: True for NoSuchKey (get_object) and 404 (head_object) errors
+    """
+    return error.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey')
+
+def _content_type(path: str) -> str:
+    """
+    Guess the Content-Type to store a file with from its path.
+    
+    Args:
+        path (str): The path of the file
+        
+    Returns:
+        str: The guessed MIME type, or application/octet-stream if it can't be guessed
+    """
+    content_type, _ = mimetypes.guess_type(path)
+    return content_type or 'application/octet-stream'
+
 class StorageInterface(ABC):
     """
     Abstract interface for file storage operations.
@@ -30,6 +89,9 @@ class StorageInterface(ABC):
     such as local filesystem, AWS S3, or other storage services.
     """
     
+    # Maximum number of operations read_many runs concurrently
+    max_concurrency = 8
+    
     @abstractmethod
     def write_binary(self, path: str, content: bytes) -> bool:
         """
@@ -57,6 +119,104 @@ class StorageInterface(ABC):
         """
         pass
     
+    def write_binary_iter(self, path: str, chunks: Iterable[bytes]) -> bool:
+        """
+        Write a sequence of binary chunks to a single file at the specified path.
+        
+        This default implementation joins the chunks and delegates to write_binary;
+        implementations may override it to avoid the concatenation.
+        
+        Args:
+            path (str): The path where the file should be stored
+            chunks (Iterable[bytes]): The binary chunks to write, in order
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.write_binary(path, b"".join(chunks))
+    
+    def write_stream(self, path: str, fileobj: BinaryIO) -> bool:
+        """
+        Write the contents of a binary file-like object to a file at the specified path.
+        
+        This default implementation reads the whole stream and delegates to write_binary;
+        implementations may override it to upload in chunks.
+        
+        Args:
+            path (str): The path where the file should be stored
+            fileobj (BinaryIO): The file-like object to read the content from
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.write_binary(path, fileobj.read())
+    
+    def copy(self, source_path: str, destination_path: str) -> bool:
+        """
+        Copy a file to another path within the same storage.
+        
+        This default implementation reads the file and writes it back; implementations
+        may override it to copy without passing the content through Python.
+        
+        Args:
+            source_path (str): The path of the file to copy
+            destination_path (str): The path to copy the file to
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        content = self.read_binary(source_path)
+        if content is None:
+            return False
+        return self.write_binary(destination_path, content)
+    
+    async def read_binary_async(self, path: str) -> Optional[bytes]:
+        """
+        Read binary content from a file without blocking the event loop.
+        
+        This default implementation runs read_binary in a worker thread.
+        
+        Args:
+            path (str): The path of the file to read
+            
+        Returns:
+            Optional[bytes]: The binary content if successful, None otherwise
+        """
+        return await asyncio.to_thread(self.read_binary, path)
+    
+    async def write_binary_async(self, path: str, content: bytes) -> bool:
+        """
+        Write binary content to a file without blocking the event loop.
+        
+        This default implementation runs write_binary in a worker thread.
+        
+        Args:
+            path (str): The path where the file should be stored
+            content (bytes): The binary content to write
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.write_binary, path, content)
+    
+    async def read_many(self, paths: Iterable[str]) -> List[Optional[bytes]]:
+        """
+        Read several files concurrently, with at most max_concurrency reads in flight.
+        
+        Args:
+            paths (Iterable[str]): The paths of the files to read
+            
+        Returns:
+            List[Optional[bytes]]: The content of each file in the order of paths, None for failed reads
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def read(path: str) -> Optional[bytes]:
+            async with semaphore:
+                return await self.read_binary_async(path)
+
+        return await asyncio.gather(*(read(path) for path in paths))
+    
     def write_text(self, path: str, content: str) -> bool:
         """
         Write text content to a file at the specified path.
@@ -109,6 +269,7 @@ class LocalFileStorage(StorageInterface):
     def __init__(self, storage_dir: str):
         self.ensure_directory_exists(storage_dir)
         self.storage_dir = storage_dir
+        self.created_directories = set()  # Directories known to exist, to skip repeated makedirs calls
 
     def write_binary(self, path: str, content: bytes) -> bool:
         """
@@ -122,23 +283,129 @@ class LocalFileStorage(StorageInterface):
             bool: True if successful, False otherwise
         """
         path = self.fq_path(path)
-
-        # ensure the directory exists
-        directory = os.path.dirname(path)
-        if not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
-            logger.info(f"Created directory: {directory}")
+        self._ensure_parent_directory(path)
 
         try:
-            # Write the content to the file
-            with open(path, 'wb') as file:
-                file.write(content)
+            # Write the content to the file, unbuffered to avoid copying it through
+            # Python's write buffer; the loop handles partial writes
+            with open(path, 'wb', buffering=0) as file:
+                view = memoryview(content)
+                while view:
+                    view = view[file.write(view):]
             logger.debug(f"Successfully wrote {len(content)} bytes to {path}")
             return True
             
         except Exception as e:
             logger.error(f"Error writing to file {path}: {e}")
             return False
+
+    def write_text(self, path: str, content: str) -> bool:
+        """
+        Write text content to a file on the local filesystem.
+        
+        The text is encoded TEXT_WRITE_CHUNK_SIZE characters at a time as it is written,
+        instead of being encoded into one bytes object of the whole content first.
+        
+        Args:
+            path (str): The path where the file should be stored relative to the storage_dir
+            content (str): The text content to write
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        path = self.fq_path(path)
+        self._ensure_parent_directory(path)
+
+        try:
+            with open(path, 'w', encoding='utf-8', newline='', buffering=TEXT_WRITE_BUFFER_SIZE) as file:
+                for start in range(0, len(content), TEXT_WRITE_CHUNK_SIZE):
+                    file.write(content[start:start + TEXT_WRITE_CHUNK_SIZE])
+            logger.debug(f"Successfully wrote {len(content)} characters to {path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error writing to file {path}: {e}")
+            return False
+
+    def write_binary_iter(self, path: str, chunks: Iterable[bytes]) -> bool:
+        """
+        Write a sequence of binary chunks to a single file on the local filesystem.
+        
+        Where available, the chunks are written with os.writev (gather write) instead of
+        being concatenated into one buffer first.
+        
+        Args:
+            path (str): The path where the file should be stored relative to the storage_dir
+            chunks (Iterable[bytes]): The binary chunks to write, in order
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not hasattr(os, 'writev'):
+            return super().write_binary_iter(path, chunks)
+
+        path = self.fq_path(path)
+        self._ensure_parent_directory(path)
+
+        try:
+            buffers = [memoryview(chunk) for chunk in chunks if chunk]
+            total = sum(len(buffer) for buffer in buffers)
+            with open(path, 'wb', buffering=0) as file:
+                while buffers:
+                    written = os.writev(file.fileno(), buffers[:IOV_MAX])
+                    # Drop fully written buffers and trim a partially written one
+                    while written and written >= len(buffers[0]):
+                        written -= len(buffers.pop(0))
+                    if written:
+                        buffers[0] = buffers[0][written:]
+            logger.debug(f"Successfully wrote {total} bytes to {path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error writing to file {path}: {e}")
+            return False
+    
+    def copy(self, source_path: str, destination_path: str) -> bool:
+        """
+        Copy a file on the local filesystem.
+        
+        Uses os.copy_file_range where available so the kernel copies the data directly
+        (or shares the blocks on filesystems that support it), falling back to a buffered copy.
+        
+        Args:
+            source_path (str): The path of the file to copy relative to the storage_dir
+            destination_path (str): The path to copy the file to relative to the storage_dir
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        source_path = self.fq_path(source_path)
+        destination_path = self.fq_path(destination_path)
+        self._ensure_parent_directory(destination_path)
+
+        try:
+            # Opening the destination for writing would truncate the source
+            if os.path.exists(destination_path) and os.path.samefile(source_path, destination_path):
+                logger.error(f"Cannot copy {source_path} onto itself")
+                return False
+            with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+                remaining = os.fstat(source.fileno()).st_size
+                try:
+                    while remaining > 0 and hasattr(os, 'copy_file_range'):
+                        copied = os.copy_file_range(source.fileno(), destination.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                except OSError as e:
+                    # Not supported for this kernel/filesystem; continue from the current offsets
+                    logger.debug(f"copy_file_range failed, falling back to buffered copy: {e}")
+                shutil.copyfileobj(source, destination, COPY_BUFFER_SIZE)
+            logger.debug(f"Successfully copied {source_path} to {destination_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error copying file {source_path} to {destination_path}: {e}")
+            return False
     
     def read_binary(self, path: str) -> Optional[bytes]:
         """
@@ -152,15 +419,17 @@ class LocalFileStorage(StorageInterface):
         """
         path = self.fq_path(path)
         try:
-            if not self.file_exists(path):
-                logger.debug(f"File does not exist: {path}")
-                return None
-                
             with open(path, 'rb') as file:
+                # The whole file is read front to back; let the kernel read ahead aggressively
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 content = file.read()
             logger.debug(f"Successfully read {len(content)} bytes from {path}")
             return content
             
+        except FileNotFoundError:
+            logger.debug(f"File does not exist: {path}")
+            return None
         except Exception as e:
             logger.error(f"Error reading file {path}: {e}")
             return None
@@ -189,9 +458,7 @@ class LocalFileStorage(StorageInterface):
             bool: True if the directory exists or was created, False otherwise
         """
         try:
-            if not os.path.exists(path):
-                os.makedirs(path, exist_ok=True)
-                logger.debug(f"Created directory: {path}")
+            os.makedirs(path, exist_ok=True)
             return True
             
         except Exception as e:
@@ -201,12 +468,29 @@ class LocalFileStorage(StorageInterface):
     def fq_path(self, path: str) -> str:
         return os.path.join(self.storage_dir, path)
 
+    def _ensure_parent_directory(self, path: str) -> None:
+        """
+        Create the parent directory of a fully qualified path unless it is already known to exist.
+        
+        Args:
+            path (str): The fully qualified file path
+        """
+        directory = os.path.dirname(path)
+        if directory not in self.created_directories:
+            os.makedirs(directory, exist_ok=True)
+            self.created_directories.add(directory)
+
 
 class S3Storage(StorageInterface):
     """
     Implementation of the StorageInterface using AWS S3.
+    
+    The read/write methods only use the underlying boto3 client, which is thread-safe,
+    so a single instance can be shared across threads (e.g. a ThreadPoolExecutor).
     """
     
+    max_concurrency = S3_MAX_POOL_CONNECTIONS
+    
     def __init__(self, bucket_name: str, aws_region: str = None, 
                  aws_access_key_id: str = None, aws_secret_access_key: str = None):
         """
@@ -219,26 +503,28 @@ class S3Storage(StorageInterface):
             aws_secret_access_key (str, optional): AWS secret access key. Defaults to None (uses boto3 default).
         """
         try:
-            import boto3
-            from botocore.exceptions import NoCredentialsError, ClientError
-            
             self.bucket_name = bucket_name
             
             # Create an S3 client
+            # Throttling and 5xx errors (SlowDown, InternalError, 500, 503, ...) are retried by
+            # botocore with exponential backoff and jitter; adaptive mode also rate limits the client.
+            # The larger connection pool avoids reconnects when the client is shared between threads.
             self.s3_client = boto3.client(
                 's3',
                 region_name=aws_region,
                 aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key
+                aws_secret_access_key=aws_secret_access_key,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries={"mode": "adaptive", "max_attempts": 5},
+                    tcp_keepalive=True
+                )
             )
             
             # Test the connection
             self.s3_client.head_bucket(Bucket=bucket_name)
             logger.info(f"Successfully connected to S3 bucket: {bucket_name}")
             
-        except ImportError:
-            logger.error("Failed to import boto3. Please install it with 'pip install boto3'")
-            raise ImportError("boto3 is required for S3Storage. Install with 'pip install boto3'")
         except (NoCredentialsError, ClientError) as e:
             logger.error(f"Failed to connect to S3 bucket {bucket_name}: {e}")
             raise Exception(f"Failed to connect to S3 bucket: {e}")
@@ -254,14 +540,18 @@ class S3Storage(StorageInterface):
         Returns:
             bool: True if successful, False otherwise
         """
+        if len(content) > S3_MULTIPART_THRESHOLD:
+            return self.write_stream(path, io.BytesIO(content))
+
         try:
-            from botocore.exceptions import ClientError
-            
-            # Upload the content directly to S3
+            # Upload the content directly to S3; the length is known up front, so botocore
+            # doesn't need to inspect the body to determine it
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=path,
-                Body=content
+                Body=content,
+                ContentLength=len(content),
+                ContentType=_content_type(path)
             )
             logger.debug(f"Successfully wrote {len(content)} bytes to s3://{self.bucket_name}/{path}")
             return True
@@ -269,6 +559,62 @@ class S3Storage(StorageInterface):
         except ClientError as e:
             logger.error(f"Error writing to S3 file s3://{self.bucket_name}/{path}: {e}")
             return False
+
+    def write_stream(self, path: str, fileobj: BinaryIO) -> bool:
+        """
+        Upload the contents of a binary file-like object to S3.
+        
+        The stream is read in chunks, and content above S3_MULTIPART_THRESHOLD is sent as a
+        multipart upload with parts uploaded in parallel, so memory use stays bounded.
+        
+        Args:
+            path (str): The path (key) where the file should be stored in S3
+            fileobj (BinaryIO): The file-like object to read the content from
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            config = TransferConfig(
+                multipart_threshold=S3_MULTIPART_THRESHOLD,
+                multipart_chunksize=S3_MULTIPART_THRESHOLD,
+                max_concurrency=4
+            )
+            self.s3_client.upload_fileobj(
+                fileobj, self.bucket_name, path,
+                ExtraArgs={'ContentType': _content_type(path)},
+                Config=config
+            )
+            logger.debug(f"Successfully uploaded stream to s3://{self.bucket_name}/{path}")
+            return True
+            
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error(f"Error uploading to S3 file s3://{self.bucket_name}/{path}: {e}")
+            return False
+    
+    def copy(self, source_path: str, destination_path: str) -> bool:
+        """
+        Copy a file within the S3 bucket without downloading it.
+        
+        Args:
+            source_path (str): The path (key) of the file to copy
+            destination_path (str): The path (key) to copy the file to
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=destination_path,
+                CopySource={'Bucket': self.bucket_name, 'Key': source_path}
+            )
+            logger.debug(f"Successfully copied s3://{self.bucket_name}/{source_path} to s3://{self.bucket_name}/{destination_path}")
+            return True
+            
+        except ClientError as e:
+            logger.error(f"Error copying S3 file s3://{self.bucket_name}/{source_path} to {destination_path}: {e}")
+            return False
     
     def read_binary(self, path: str) -> Optional[bytes]:
         """
@@ -281,13 +627,8 @@ class S3Storage(StorageInterface):
             Optional[bytes]: The binary content if successful, None otherwise
         """
         try:
-            from botocore.exceptions import ClientError
-            
-            if not self.file_exists(path):
-                logger.debug(f"File does not exist: s3://{self.bucket_name}/{path}")
-                return None
-                
-            # Get the object from S3
+            # Get the object from S3; a missing key is reported as a NoSuchKey error below,
+            # so there is no need for a separate head_object round-trip first
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
                 Key=path
@@ -299,7 +640,7 @@ class S3Storage(StorageInterface):
             return content
             
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
+            if _is_not_found(e):
                 logger.debug(f"File does not exist: s3://{self.bucket_name}/{path}")
                 return None
             logger.error(f"Error reading S3 file s3://{self.bucket_name}/{path}: {e}")
@@ -316,8 +657,6 @@ class S3Storage(StorageInterface):
             bool: True if the file exists, False otherwise
         """
         try:
-            from botocore.exceptions import ClientError
-            
             # Try to get the object head
             self.s3_client.head_object(
                 Bucket=self.bucket_name,
@@ -326,27 +665,240 @@ class S3Storage(StorageInterface):
             return True
             
         except ClientError as e:
-            if e.response['Error']['Code'] == '404':
+            if _is_not_found(e):
                 return False
             logger.error(f"Error checking if S3 file exists s3://{self.bucket_name}/{path}: {e}")
             return False
 
 
+class CachingStorage(StorageInterface):
+    """
+    StorageInterface decorator that keeps recently read files in an in-process LRU cache.
+    
+    Cached entries expire after ttl seconds so that changes made by other processes are
+    eventually picked up; writes made through this instance invalidate the entry immediately.
+    Missing files are not cached.
+    
+    With readahead enabled, two consecutive reads of paths that differ only by a number
+    incremented by one (e.g. "log-7.json" then "log-8.json") cause the next path in the
+    sequence to be read into the cache in the background.
+    """
+    
+    def __init__(self, inner: StorageInterface, maxsize: int = 128, ttl: float = 60, readahead: bool = False):
+        """
+        Initialize the caching storage.
+        
+        Args:
+            inner (StorageInterface): The storage implementation to cache reads for
+            maxsize (int, optional): Maximum number of cached files. Defaults to 128.
+            ttl (float, optional): Seconds a cached file is served without re-reading it. Defaults to 60.
+            readahead (bool, optional): Prefetch the next file of sequential reads. Defaults to False.
+        """
+        self.inner = inner
+        self.max_concurrency = inner.max_concurrency
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache = OrderedDict()  # path -> (content, expiry as time.monotonic() value)
+        # path -> [reads in flight, invalidations since the first of them], so reads that
+        # overlap a write don't cache stale content; entries are dropped once no read is in flight
+        self.pending_reads = {}
+        self.lock = threading.Lock()
+        self.readahead = readahead
+        self.last_read_path = None
+        self.readahead_executor = ThreadPoolExecutor(max_workers=2) if readahead else None
+    
+    def write_binary(self, path: str, content: bytes) -> bool:
+        try:
+            return self.inner.write_binary(path, content)
+        finally:
+            self._invalidate(path)
+    
+    def write_text(self, path: str, content: str) -> bool:
+        try:
+            return self.inner.write_text(path, content)
+        finally:
+            self._invalidate(path)
+    
+    def write_binary_iter(self, path: str, chunks: Iterable[bytes]) -> bool:
+        try:
+            return self.inner.write_binary_iter(path, chunks)
+        finally:
+            self._invalidate(path)
+    
+    def write_stream(self, path: str, fileobj: BinaryIO) -> bool:
+        try:
+            return self.inner.write_stream(path, fileobj)
+        finally:
+            self._invalidate(path)
+    
+    def copy(self, source_path: str, destination_path: str) -> bool:
+        try:
+            return self.inner.copy(source_path, destination_path)
+        finally:
+            self._invalidate(destination_path)
+    
+    def read_binary(self, path: str) -> Optional[bytes]:
+        if self.readahead:
+            self._schedule_readahead(path)
+
+        content = self._get_cached(path)
+        if content is not None:
+            logger.debug(f"Cache hit for {path}")
+            return content
+        
+        generation = self._start_read(path)
+        content = None
+        try:
+            content = self.inner.read_binary(path)
+        finally:
+            self._finish_read(path, content, generation)
+        return content
+    
+    def file_exists(self, path: str) -> bool:
+        return self._get_cached(path) is not None or self.inner.file_exists(path)
+    
+    def _schedule_readahead(self, path: str) -> None:
+        """
+        Prefetch the next path in the background if this read continues a numeric sequence.
+        
+        Args:
+            path (str): The path being read
+        """
+        with self.lock:
+            previous_path, self.last_read_path = self.last_read_path, path
+        if previous_path is None or self._next_sequential_path(previous_path) != path:
+            return
+
+        next_path = self._next_sequential_path(path)
+        if self._get_cached(next_path) is None:
+            logger.debug(f"Sequential reads detected, prefetching {next_path}")
+            self.readahead_executor.submit(self._prefetch, next_path)
+
+    def _prefetch(self, path: str) -> None:
+        """
+        Read a file from the wrapped storage into the cache.
+        
+        Args:
+            path (str): The path of the file to prefetch
+        """
+        generation = self._start_read(path)
+        content = None
+        try:
+            content = self.inner.read_binary(path)
+        except Exception as e:
+            logger.debug(f"Failed to prefetch {path}: {e}")
+        finally:
+            self._finish_read(path, content, generation)
+
+    @staticmethod
+    def _next_sequential_path(path: str) -> Optional[str]:
+        """
+        Get the path following the given one in a numeric sequence, preserving zero padding.
+        
+        Args:
+            path (str): The path; its last number is incremented
+            
+        Returns:
+            Optional[str]: The next path, or None if the path contains no number
+        """
+        match = re.search(r"(\d+)(\D*)$", path)
+        if match is None:
+            return None
+        number = match.group(1)
+        return f"{path[:match.start()]}{str(int(number) + 1).zfill(len(number))}{match.group(2)}"
+
+    def _get_cached(self, path: str) -> Optional[bytes]:
+        """
+        Get the cached content of a file if it is cached and has not expired.
+        
+        Args:
+            path (str): The path of the file
+            
+        Returns:
+            Optional[bytes]: The cached content, or None if not cached
+        """
+        with self.lock:
+            entry = self.cache.get(path)
+            if entry is None:
+                return None
+            content, expiry = entry
+            if expiry <= time.monotonic():
+                del self.cache[path]
+                return None
+            self.cache.move_to_end(path)
+            return content
+    
+    def _start_read(self, path: str) -> int:
+        """
+        Register a read of a file from the wrapped storage; it must be ended with _finish_read.
+        
+        Args:
+            path (str): The path of the file
+            
+        Returns:
+            int: The number of times the file has been invalidated while reads were in flight,
+                to pass to _finish_read
+        """
+        with self.lock:
+            pending = self.pending_reads.setdefault(path, [0, 0])
+            pending[0] += 1
+            return pending[1]
+    
+    def _finish_read(self, path: str, content: Optional[bytes], generation: int) -> None:
+        """
+        End a read registered with _start_read and cache its content.
+        
+        The content is not cached if the file was invalidated since it was read. The least
+        recently used entries are evicted if the cache is full.
+        
+        Args:
+            path (str): The path of the file
+            content (Optional[bytes]): The content read, or None if the file wasn't found or the read failed
+            generation (int): The value returned by _start_read
+        """
+        with self.lock:
+            pending = self.pending_reads[path]
+            pending[0] -= 1
+            if pending[0] == 0:
+                del self.pending_reads[path]
+            if content is None or pending[1] != generation:
+                return
+            self.cache[path] = (content, time.monotonic() + self.ttl)
+            self.cache.move_to_end(path)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+    
+    def _invalidate(self, path: str) -> None:
+        """
+        Remove a file from the cache.
+        
+        Args:
+            path (str): The path of the file
+        """
+        with self.lock:
+            self.cache.pop(path, None)
+            pending = self.pending_reads.get(path)
+            if pending is not None:
+                pending[1] += 1
+
+
 def create_storage() -> StorageInterface:
     """
     Factory function to create the appropriate storage implementation based on configuration.
 
+    Reads are served through a CachingStorage in front of the configured backend.
+
     Returns:
         StorageInterface: The configured storage implementation
     """
     if STORAGE_TYPE.lower() == "s3":
         logger.info(f"Using S3 storage with bucket: {S3_BUCKET_NAME}")
-        return S3Storage(
+        return CachingStorage(S3Storage(
             bucket_name=S3_BUCKET_NAME,
             aws_region=S3_REGION,
             aws_access_key_id=S3_ACCESS_KEY_ID,
             aws_secret_access_key=S3_SECRET_ACCESS_KEY
-        )
-    else:
-        logger.info(f"Using local file storage at: {LOCAL_STORAGE_DIR}")
-        return LocalFileStorage(LOCAL_STORAGE_DIR)
+        ))
+
+    logger.info(f"Using local file storage at: {LOCAL_STORAGE_DIR}")
+    return CachingStorage(LocalFileStorage(LOCAL_STORAGE_DIR))
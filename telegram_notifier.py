@@ -8,9 +8,13 @@ This module provides a centralized way to send Telegram notifications
 across different parts of the application.
 """
 
+import atexit
+import concurrent.futures
 import logging
 import asyncio
+import threading
 import telegram
+from telegram.request import HTTPXRequest
 from typing import Optional
 from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 
@@ -19,22 +23,155 @@ logger = logging.getLogger(__name__)
 
 # Telegram configuration constants are now imported from config.py
 
-class TelegramNotifier:
+# Messages queued while a send is in flight are combined into the next Telegram message
+MESSAGE_SEPARATOR = "\n\n"
+# Telegram rejects text messages longer than this
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+# Seconds the sync wrappers wait for a send before giving up
+TELEGRAM_SEND_TIMEOUT = 60
+
+class _TelegramClient:
     """
-    A class that handles sending notifications to Telegram.
+    Process-wide Telegram client shared by all TelegramNotifier instances (see get_notifier).
+
+    Notifications are sent from a background event loop owned by the client, which keeps
+    the Bot's connections open between sends. The async methods can be awaited from any
+    event loop; they run their work on the client's loop.
     """
     
     def __init__(self):
         """
-        Initialize the TelegramNotifier.
+        Initialize the Telegram client.
         """
         self.bot_token = TELEGRAM_BOT_TOKEN
         self.chat_id = TELEGRAM_CHAT_ID
-        
+        # A single Bot is reused for all notifications so consecutive sends share its connection pool
+        self.bot = telegram.Bot(
+            token=self.bot_token,
+            request=HTTPXRequest(connection_pool_size=8, http_version="1.1")
+        )
+        self.bot_init_lock = None
+        self.closed = False
+        # Persistent event loop running in a background thread. The sync wrappers submit their
+        # coroutines to it, so the Bot's connections stay bound to one loop across notifications.
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="telegram-notifier", daemon=True).start()
+        # Text messages are queued and sent by _flush_messages (photos are sent directly). The queue
+        # is created on the client's loop, as asyncio objects bind to the loop they're created on
+        # in Python < 3.10.
+        self.message_queue = self._run(self._create_queue()).result(timeout=TELEGRAM_SEND_TIMEOUT)
+        self.flush_future = self._run(self._flush_messages())
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """
+        Stop the message flusher and the background event loop, closing the Bot's connections.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.flush_future.cancel()
+        try:
+            self._run(self.bot.shutdown()).result(timeout=TELEGRAM_SEND_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Failed to shut down Telegram bot: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _run(self, coroutine) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the client's event loop.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            concurrent.futures.Future: The future for the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    @staticmethod
+    async def _create_queue() -> asyncio.Queue:
+        return asyncio.Queue()
+
+    async def _get_bot(self) -> telegram.Bot:
+        """
+        Get the shared Bot, initializing it (and its connection pool) on first use.
+
+        Returns:
+            telegram.Bot: The initialized Bot
+        """
+        if self.bot_init_lock is None:
+            self.bot_init_lock = asyncio.Lock()
+        async with self.bot_init_lock:
+            await self.bot.initialize()
+        return self.bot
+
     async def send_async_message(self, message: str) -> bool:
         """
         Send a message to the configured Telegram chat asynchronously.
 
+        Messages queued while another message is being sent are combined with it into
+        a single Telegram message.
+
+        Args:
+            message (str): The message to send
+
+        Returns:
+            bool: True if the message was sent successfully, False otherwise
+        """
+        return await asyncio.wrap_future(self._run(self._queue_message(message)))
+
+    async def _queue_message(self, message: str) -> bool:
+        """
+        Queue a message for _flush_messages and wait until it has been sent. Runs on self.loop.
+
+        Args:
+            message (str): The message to send
+
+        Returns:
+            bool: True if the message was sent successfully, False otherwise
+        """
+        if not isinstance(message, str):
+            logger.error(f"Failed to send Telegram message: expected str, got {type(message).__name__}")
+            return False
+        future = self.loop.create_future()
+        await self.message_queue.put((message, future))
+        return await future
+
+    async def _flush_messages(self) -> None:
+        """
+        Consume the message queue forever. Each message is sent as soon as it is queued, together
+        with any other messages that are already waiting (up to Telegram's length limit).
+        """
+        pending = None
+        while True:
+            batch = [pending or await self.message_queue.get()]
+            pending = None
+            try:
+                length = len(batch[0][0])
+
+                while not self.message_queue.empty():
+                    item = self.message_queue.get_nowait()
+                    if length + len(MESSAGE_SEPARATOR) + len(item[0]) > TELEGRAM_MAX_MESSAGE_LENGTH:
+                        # Doesn't fit in this message; it starts the next batch
+                        pending = item
+                        break
+                    batch.append(item)
+                    length += len(MESSAGE_SEPARATOR) + len(item[0])
+
+                result = await self._send_text(MESSAGE_SEPARATOR.join(message for message, _ in batch))
+            except Exception as e:
+                # Fail only this batch; the flusher keeps serving later messages
+                logger.error(f"Failed to send queued Telegram messages: {e!r}")
+                result = False
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _send_text(self, message: str) -> bool:
+        """
+        Send a single text message to the configured Telegram chat.
+
         Args:
             message (str): The message to send
 
@@ -42,7 +179,7 @@ class TelegramNotifier:
             bool: True if the message was sent successfully, False otherwise
         """
         try:
-            bot = telegram.Bot(token=self.bot_token)
+            bot = await self._get_bot()
             await bot.send_message(chat_id=self.chat_id, text=message)
             logger.info(f"Telegram message sent: {message}")
             return True
@@ -54,6 +191,19 @@ class TelegramNotifier:
         """
         Send a photo to the configured Telegram chat asynchronously.
 
+        Args:
+            photo: The image data to send (PNG/JPEG).
+            caption: Caption text for the photo (max 1024 chars).
+
+        Returns:
+            True if the photo was sent successfully, False otherwise.
+        """
+        return await asyncio.wrap_future(self._run(self._send_photo(photo, caption)))
+
+    async def _send_photo(self, photo: bytes, caption: Optional[str] = None) -> bool:
+        """
+        Send a photo to the configured Telegram chat. Runs on self.loop.
+
         Args:
             photo: The image data to send (PNG/JPEG).
             caption: Caption text for the photo (max 1024 chars).
@@ -62,7 +212,7 @@ class TelegramNotifier:
             True if the photo was sent successfully, False otherwise.
         """
         try:
-            bot = telegram.Bot(token=self.bot_token)
+            bot = await self._get_bot()
             await bot.send_photo(
                 chat_id=self.chat_id,
                 photo=photo,
@@ -85,16 +235,9 @@ class TelegramNotifier:
             bool: True if the message was sent successfully, False otherwise
         """
         try:
-            # Create a new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            # Run the async function in the loop
-            result = loop.run_until_complete(self.send_async_message(message))
-            loop.close()
-            return result
+            return self._run(self._queue_message(message)).result(timeout=TELEGRAM_SEND_TIMEOUT)
         except Exception as e:
-            logger.error(f"Error in Telegram notification: {e}")
+            logger.error(f"Error in Telegram notification: {e!r}")
             return False
 
     def send_photo(self, photo: bytes, caption: Optional[str] = None) -> bool:
@@ -109,11 +252,84 @@ class TelegramNotifier:
             True if the photo was sent successfully, False otherwise.
         """
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.send_async_photo(photo, caption))
-            loop.close()
-            return result
+            return self._run(self._send_photo(photo, caption)).result(timeout=TELEGRAM_SEND_TIMEOUT)
         except Exception as e:
-            logger.error(f"Error in Telegram photo notification: {e}")
-            return False
\ No newline at end of file
+            logger.error(f"Error in Telegram photo notification: {e!r}")
+            return False
+
+
+_client: Optional[_TelegramClient] = None
+_client_lock = threading.Lock()
+
+
+def get_notifier() -> _TelegramClient:
+    """
+    Get the process-wide Telegram client, creating it on first use.
+
+    Returns:
+        _TelegramClient: The shared client with its Bot, event loop and connection pool
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = _TelegramClient()
+        return _client
+
+
+class TelegramNotifier:
+    """
+    A class that handles sending notifications to Telegram.
+
+    All instances delegate to the process-wide client returned by get_notifier, so creating
+    several notifiers doesn't create several Bots, event loops or connection pools.
+    """
+
+    async def send_async_message(self, message: str) -> bool:
+        """
+        Send a message to the configured Telegram chat asynchronously.
+
+        Args:
+            message (str): The message to send
+
+        Returns:
+            bool: True if the message was sent successfully, False otherwise
+        """
+        return await get_notifier().send_async_message(message)
+
+    async def send_async_photo(self, photo: bytes, caption: Optional[str] = None) -> bool:
+        """
+        Send a photo to the configured Telegram chat asynchronously.
+
+        Args:
+            photo: The image data to send (PNG/JPEG).
+            caption: Caption text for the photo (max 1024 chars).
+
+        Returns:
+            True if the photo was sent successfully, False otherwise.
+        """
+        return await get_notifier().send_async_photo(photo, caption)
+
+    def send_message(self, message: str) -> bool:
+        """
+        Synchronous wrapper for sending Telegram messages.
+
+        Args:
+            message (str): The message to send
+
+        Returns:
+            bool: True if the message was sent successfully, False otherwise
+        """
+        return get_notifier().send_message(message)
+
+    def send_photo(self, photo: bytes, caption: Optional[str] = None) -> bool:
+        """
+        Synchronous wrapper for sending Telegram photos.
+
+        Args:
+            photo: The image data to send (PNG/JPEG).
+            caption: Caption text for the photo (max 1024 chars).
+
+        Returns:
+            True if the photo was sent successfully, False otherwise.
+        """
+        return get_notifier().send_photo(photo, caption)
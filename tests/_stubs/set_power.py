@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Stand-in for set_power used by the tests.
+
+The real module imports playwright, which isn't needed (or may not be installed)
+where the tests run. The set_power_stub fixture in tests/conftest.py loads this
+module; tests that run price_analyzer.main() install it as sys.modules['set_power']
+so that `from set_power import SetPower, SetPowerError` resolves here.
+"""
+
+
+class SetPowerError(Exception):
+    """Error raised when setting the power limit fails."""
+
+    def __init__(self, message: str, screenshot=None, stage=None):
+        super().__init__(message)
+        self.screenshot = screenshot
+        self.stage = stage
+
+
+class SetPower:
+    """Placeholder for the Playwright-driven SetPower; tests replace it with a mock."""
+
+    def __init__(self, username, password, storage, screenshot_level="errors", debug=False):
+        pass
+
+    def set_power_limit(self, power_limit):
+        return False
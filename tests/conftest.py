@@ -6,7 +6,11 @@ This file automatically applies to all tests in the tests/ directory.
 It sets up the environment to avoid configuration dependencies.
 """
 
+import importlib.util
 import os
+from pathlib import Path
+
+import pytest
 
 # Set minimal environment variables needed for tests
 # Only the ones without defaults in config.py are required
@@ -16,3 +20,18 @@ os.environ.update({
     'TELEGRAM_BOT_TOKEN': 'test_token',
     'TELEGRAM_CHAT_ID': 'test_chat'
 })
+
+
+@pytest.fixture(scope="session")
+def set_power_stub():
+    """
+    The playwright-free stand-in for set_power from tests/_stubs.
+
+    It is loaded without being registered in sys.modules; tests that need it
+    install it there themselves, so the real set_power stays importable elsewhere.
+    """
+    spec = importlib.util.spec_from_file_location("set_power", Path(__file__).parent / "_stubs" / "set_power.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for the CachingStorage read cache.
+
+These tests verify that:
+- repeated reads are served from the cache instead of the wrapped storage
+- writes and copies invalidate cached entries, including ones that race a read
+- paths are only tracked while a read of them is in flight
+- entries expire after the TTL and the least recently used entry is evicted first
+- sequential reads prefetch the next file when readahead is enabled
+- read_many returns contents in input order with bounded concurrency
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+from storage_interface import CachingStorage, StorageInterface
+
+
+class InMemoryStorage(StorageInterface):
+    """Dictionary-backed storage that counts reads."""
+
+    def __init__(self):
+        self.files = {}
+        self.reads = []
+        self.on_read = None  # Called with the path during each read, after the content is read
+
+    def write_binary(self, path: str, content: bytes) -> bool:
+        self.files[path] = content
+        return True
+
+    def read_binary(self, path: str) -> Optional[bytes]:
+        self.reads.append(path)
+        content = self.files.get(path)
+        if self.on_read is not None:
+            self.on_read(path)
+        return content
+
+    def file_exists(self, path: str) -> bool:
+        return path in self.files
+
+
+class TestCachingStorage:
+    """Tests for CachingStorage."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.inner = InMemoryStorage()
+        self.inner.files = {"a.json": b"a", "b.json": b"b", "c.json": b"c"}
+        self.storage = CachingStorage(self.inner, maxsize=2, ttl=60)
+
+    def test_repeated_reads_hit_cache(self):
+        """The second read of a file does not reach the wrapped storage."""
+        assert self.storage.read_binary("a.json") == b"a"
+        assert self.storage.read_text("a.json") == "a"
+
+        assert self.inner.reads == ["a.json"]
+
+    def test_missing_files_are_not_cached(self):
+        """A missing file is looked up again on every read."""
+        assert self.storage.read_binary("missing.json") is None
+        assert self.storage.read_binary("missing.json") is None
+
+        assert self.inner.reads == ["missing.json", "missing.json"]
+
+    def test_write_invalidates_cached_entry(self):
+        """A write through the cache is visible to the next read."""
+        self.storage.read_binary("a.json")
+        self.storage.write_text("a.json", "updated")
+
+        assert self.storage.read_binary("a.json") == b"updated"
+
+    def test_copy_invalidates_destination(self):
+        """Copying over a cached file makes the next read return the copied content."""
+        self.storage.read_binary("b.json")
+
+        assert self.storage.copy("a.json", "b.json") is True
+        assert self.storage.read_binary("b.json") == b"a"
+
+    def test_read_overlapping_write_is_not_cached(self):
+        """Content read before a concurrent write is not put back into the cache."""
+        self.inner.on_read = lambda path: self.storage.write_binary(path, b"updated")
+
+        assert self.storage.read_binary("a.json") == b"a"
+        self.inner.on_read = None
+
+        assert self.storage.read_binary("a.json") == b"updated"
+
+    def test_prefetch_overlapping_write_is_not_cached(self):
+        """A prefetch that races a write doesn't cache the old content."""
+        self.inner.on_read = lambda path: self.storage.write_binary(path, b"updated")
+
+        self.storage._prefetch("a.json")
+
+        assert "a.json" not in self.storage.cache
+
+    def test_no_read_state_is_kept_after_reads_finish(self):
+        """Paths are only tracked while a read of them is in flight, even if it fails."""
+        self.storage.read_binary("a.json")
+        self.storage.write_binary("a.json", b"updated")
+        self.storage.write_binary("new.json", b"new")
+
+        def failing_read(path):
+            raise OSError("read failed")
+
+        self.inner.on_read = failing_read
+        with pytest.raises(OSError):
+            self.storage.read_binary("b.json")
+
+        assert self.storage.pending_reads == {}
+
+    def test_expired_entry_is_read_again(self):
+        """Entries older than the TTL are re-read from the wrapped storage."""
+        storage = CachingStorage(self.inner, ttl=0)
+        storage.read_binary("a.json")
+        storage.read_binary("a.json")
+
+        assert self.inner.reads == ["a.json", "a.json"]
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """When the cache is full the least recently used entry is dropped."""
+        self.storage.read_binary("a.json")
+        self.storage.read_binary("b.json")
+        self.storage.read_binary("a.json")  # a.json is now the most recently used
+        self.storage.read_binary("c.json")  # evicts b.json
+        self.inner.reads.clear()
+
+        self.storage.read_binary("a.json")
+        self.storage.read_binary("b.json")
+
+        assert self.inner.reads == ["b.json"]
+
+    def test_sequential_reads_prefetch_next_file(self):
+        """Two sequential reads prefetch the next file when readahead is enabled."""
+        self.inner.files = {f"log-{i:02d}.json": str(i).encode() for i in range(8, 12)}
+        storage = CachingStorage(self.inner, readahead=True)
+
+        storage.read_binary("log-08.json")
+        storage.read_binary("log-09.json")
+        storage.readahead_executor.shutdown(wait=True)
+
+        assert "log-10.json" in storage.cache
+        assert sorted(self.inner.reads) == ["log-08.json", "log-09.json", "log-10.json"]
+
+    def test_no_prefetch_without_readahead(self):
+        """Sequential reads do not prefetch anything by default."""
+        self.inner.files = {f"log-{i}.json": str(i).encode() for i in range(1, 4)}
+
+        self.storage.read_binary("log-1.json")
+        self.storage.read_binary("log-2.json")
+
+        assert self.inner.reads == ["log-1.json", "log-2.json"]
+
+
+class TestReadMany:
+    """Tests for StorageInterface.read_many."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.storage = InMemoryStorage()
+        self.storage.files = {f"{i}.json": str(i).encode() for i in range(10)}
+
+    def test_results_follow_input_order(self):
+        """Contents come back in the order of the paths, with None for missing files."""
+        paths = ["3.json", "missing.json", "0.json", "9.json"]
+
+        assert asyncio.run(self.storage.read_many(paths)) == [b"3", None, b"0", b"9"]
+
+    def test_concurrency_is_bounded(self):
+        """No more than max_concurrency reads are in flight at once."""
+        self.storage.max_concurrency = 2
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_read(path):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+        self.storage.on_read = slow_read
+        paths = sorted(self.storage.files)
+
+        assert asyncio.run(self.storage.read_many(paths)) == [self.storage.files[path] for path in paths]
+        assert peak == 2
@@ -6,56 +6,42 @@ These tests verify that is_scheduled_event() correctly distinguishes between
 CloudWatch Events / EventBridge Scheduler invocations and manual triggers.
 """
 
-from price_analyzer_lambda import is_scheduled_event
+import pytest
+
+
+@pytest.fixture(scope="module")
+def is_scheduled_event():
+    """Import is_scheduled_event on first use rather than when the module is collected."""
+    from price_analyzer_lambda import is_scheduled_event
+    return is_scheduled_event
 
 
 class TestIsScheduledEvent:
     """Test is_scheduled_event helper function."""
 
-    def test_cloudwatch_events_scheduled(self):
-        """CloudWatch Events scheduled event is detected."""
-        event = {
+    @pytest.mark.parametrize("event,expected", [
+        # CloudWatch Events scheduled event is detected
+        ({
             "detail-type": "Scheduled Event",
             "source": "aws.events",
             "id": "abc123",
             "resources": ["arn:aws:events:..."],
             "detail": {}
-        }
-        assert is_scheduled_event(event) is True
-
-    def test_eventbridge_scheduler(self):
-        """EventBridge Scheduler event is detected."""
-        event = {
-            "detail-type": "Scheduled Event",
-            "source": "aws.scheduler",
-        }
-        assert is_scheduled_event(event) is True
-
-    def test_empty_event_is_manual(self):
-        """Empty event (manual invoke) is not scheduled."""
-        assert is_scheduled_event({}) is False
-
-    def test_custom_payload_is_manual(self):
-        """Custom payload without scheduled fields is manual."""
-        event = {"custom": "data", "test": True}
-        assert is_scheduled_event(event) is False
-
-    def test_none_event_is_manual(self):
-        """None event is not scheduled."""
-        assert is_scheduled_event(None) is False
-
-    def test_wrong_detail_type(self):
-        """Event with different detail-type is not scheduled."""
-        event = {
-            "detail-type": "Custom Event",
-            "source": "aws.events",
-        }
-        assert is_scheduled_event(event) is False
-
-    def test_wrong_source(self):
-        """Event with different source is not scheduled."""
-        event = {
-            "detail-type": "Scheduled Event",
-            "source": "custom.source",
-        }
-        assert is_scheduled_event(event) is False
+        }, True),
+        # EventBridge Scheduler event is detected
+        ({"detail-type": "Scheduled Event", "source": "aws.scheduler"}, True),
+        # Empty event (manual invoke) is not scheduled
+        ({}, False),
+        # Custom payload without scheduled fields is manual
+        ({"custom": "data", "test": True}, False),
+        # None event is not scheduled
+        (None, False),
+        # Event with different detail-type is not scheduled
+        ({"detail-type": "Custom Event", "source": "aws.events"}, False),
+        # Event with different source is not scheduled
+        ({"detail-type": "Scheduled Event", "source": "custom.source"}, False),
+    ], ids=["cloudwatch_events", "eventbridge_scheduler", "empty", "custom_payload", "none",
+            "wrong_detail_type", "wrong_source"])
+    def test_is_scheduled_event(self, is_scheduled_event, event, expected):
+        """Scheduled invocations are told apart from manual triggers."""
+        assert is_scheduled_event(event) is expected
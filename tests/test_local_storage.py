@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for LocalFileStorage.
+
+These tests verify that:
+- text and binary content round-trip, including large files
+- chunked writes produce the concatenated content
+- copies reproduce the source and refuse to copy a file onto itself
+"""
+
+import pytest
+
+import storage_interface
+from storage_interface import LocalFileStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Local storage rooted in a fresh temporary directory."""
+    return LocalFileStorage(str(tmp_path))
+
+
+class TestLocalFileStorage:
+    """Tests for LocalFileStorage."""
+
+    def test_write_text_round_trip(self, storage, monkeypatch):
+        """Text written in several encoding chunks reads back unchanged."""
+        monkeypatch.setattr(storage_interface, "TEXT_WRITE_CHUNK_SIZE", 3)
+        text = "цена\r\n€ ok" * 5
+
+        assert storage.write_text("nested/prices.txt", text) is True
+        assert storage.read_text("nested/prices.txt") == text
+        assert storage.read_binary("nested/prices.txt") == text.encode("utf-8")
+
+    def test_large_file_is_read_in_full(self, storage):
+        """Multi-megabyte files are read back in full, as bytes and as text."""
+        content = b"x" * (4 * 1024 * 1024 + 1)
+        storage.write_binary("large.bin", content)
+
+        assert storage.read_binary("large.bin") == content
+        assert storage.read_text("large.bin") == content.decode()
+
+    def test_missing_file_reads_as_none(self, storage):
+        """Reading a file that doesn't exist returns None."""
+
+        assert storage.read_binary("missing.bin") is None
+        assert storage.read_text("missing.txt") is None
+
+    def test_write_binary_iter_concatenates_chunks(self, storage):
+        """Chunks are written to the file in order, skipping empty ones."""
+
+        assert storage.write_binary_iter("chunks.bin", [b"ab", b"", b"cd", b"e"]) is True
+        assert storage.read_binary("chunks.bin") == b"abcde"
+
+    def test_copy(self, storage):
+        """A copy has the same content as the source."""
+        storage.write_binary("source.bin", b"payload")
+
+        assert storage.copy("source.bin", "copies/destination.bin") is True
+        assert storage.read_binary("copies/destination.bin") == b"payload"
+
+    def test_copy_onto_itself_keeps_content(self, storage):
+        """Copying a file onto itself fails without truncating it."""
+        storage.write_binary("self.bin", b"payload")
+
+        assert storage.copy("self.bin", "self.bin") is False
+        assert storage.read_binary("self.bin") == b"payload"
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for S3Storage uploads.
+
+These tests verify that:
+- small payloads are uploaded with put_object, with their length and content type
+- large payloads go through a multipart upload with the same content type
+"""
+
+from unittest.mock import Mock
+
+import storage_interface
+from storage_interface import S3Storage
+
+
+class TestS3StorageWrites:
+    """Tests for S3Storage.write_binary."""
+
+    def setup_method(self):
+        """Set up an S3Storage backed by a mock client, without connecting to S3."""
+        self.storage = S3Storage.__new__(S3Storage)
+        self.storage.bucket_name = "bucket"
+        self.storage.s3_client = Mock()
+
+    def test_small_payload_uses_put_object(self):
+        """Payloads up to the multipart threshold are sent with their length and content type."""
+        assert self.storage.write_binary("prices/2025-02-14.json", b"{}") is True
+
+        self.storage.s3_client.put_object.assert_called_once_with(
+            Bucket="bucket",
+            Key="prices/2025-02-14.json",
+            Body=b"{}",
+            ContentLength=2,
+            ContentType="application/json"
+        )
+
+    def test_large_payload_keeps_content_type(self, monkeypatch):
+        """Payloads above the multipart threshold are uploaded with the same content type."""
+        monkeypatch.setattr(storage_interface, "S3_MULTIPART_THRESHOLD", 1)
+
+        assert self.storage.write_binary("prices/2025-02-14.json", b"{}") is True
+
+        self.storage.s3_client.put_object.assert_not_called()
+        extra_args = self.storage.s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        assert extra_args == {"ContentType": "application/json"}
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the Telegram notifier's message queue.
+
+These tests verify that:
+- a message is sent right away when nothing else is queued
+- messages queued while a send is in flight are combined into the next message
+- combined messages never exceed Telegram's message length limit
+- a failed batch or an invalid message doesn't stop later sends
+- the async API can be awaited from any event loop
+- TelegramNotifier instances delegate to the shared client
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch, Mock
+
+from telegram_notifier import MESSAGE_SEPARATOR, TELEGRAM_MAX_MESSAGE_LENGTH, TelegramNotifier, _TelegramClient
+
+
+class TestTelegramMessageQueue:
+    """Tests for batching in _TelegramClient."""
+
+    def setup_method(self):
+        """Set up a client whose sends are recorded instead of reaching Telegram."""
+        self.client = _TelegramClient()
+        self.sent = []
+        self.first_send_started = threading.Event()
+        self.release = None
+
+        async def fake_send_text(message: str) -> bool:
+            self.sent.append(message)
+            if self.release is not None and not self.first_send_started.is_set():
+                self.first_send_started.set()
+                await self.release.wait()
+            return True
+
+        self.client._send_text = fake_send_text
+
+    def teardown_method(self):
+        """Stop the client's event loop."""
+        self.client.close()
+
+    def _block_first_send(self):
+        """Make the first send wait until _unblock() is called."""
+        self.release = self.client._run(self._create_event()).result(timeout=5)
+
+    @staticmethod
+    async def _create_event() -> asyncio.Event:
+        return asyncio.Event()
+
+    def _unblock(self):
+        self.client.loop.call_soon_threadsafe(self.release.set)
+
+    def _queue(self, *messages):
+        """Queue messages from the test thread and wait until they're all in the queue."""
+        futures = [self.client._run(self.client._queue_message(message)) for message in messages]
+        while self.client.message_queue.qsize() < len(messages):
+            threading.Event().wait(0.01)
+        return futures
+
+    def test_single_message_is_sent_alone(self):
+        """A message sent with nothing else queued goes out on its own."""
+        assert self.client.send_message("hello") is True
+        assert self.sent == ["hello"]
+
+    def test_messages_queued_during_a_send_are_combined(self):
+        """Messages that queue up while a send is in flight are sent as one message."""
+        self._block_first_send()
+        first = self.client._run(self.client._queue_message("first"))
+        assert self.first_send_started.wait(timeout=5)
+
+        futures = self._queue("second", "third")
+        self._unblock()
+
+        assert all(future.result(timeout=5) for future in [first] + futures)
+        assert self.sent == ["first", MESSAGE_SEPARATOR.join(["second", "third"])]
+
+    def test_combined_messages_respect_length_limit(self):
+        """A message that would push a batch over the limit starts the next one."""
+        long_a = "a" * (TELEGRAM_MAX_MESSAGE_LENGTH - 100)
+        long_b = "b" * (TELEGRAM_MAX_MESSAGE_LENGTH - 100)
+        self._block_first_send()
+        first = self.client._run(self.client._queue_message("first"))
+        assert self.first_send_started.wait(timeout=5)
+
+        futures = self._queue(long_a, long_b, "tail")
+        self._unblock()
+
+        assert all(future.result(timeout=5) for future in [first] + futures)
+        assert self.sent == ["first", long_a, MESSAGE_SEPARATOR.join([long_b, "tail"])]
+        assert all(len(message) <= TELEGRAM_MAX_MESSAGE_LENGTH for message in self.sent)
+
+    def test_flusher_survives_a_failed_batch(self):
+        """A batch that fails to send doesn't stop later messages from being sent."""
+        send_text = self.client._send_text
+
+        async def failing_send_text(message: str) -> bool:
+            self.client._send_text = send_text
+            raise RuntimeError("send failed")
+
+        self.client._send_text = failing_send_text
+
+        assert self.client.send_message("broken") is False
+        assert self.client.send_message("hello") is True
+        assert self.sent == ["hello"]
+
+    def test_non_text_message_is_rejected(self):
+        """A message that isn't a str fails on its own without reaching the queue."""
+        assert self.client.send_message(None) is False
+        assert self.client.send_message("hello") is True
+        assert self.sent == ["hello"]
+
+    def test_send_async_message_from_another_loop(self):
+        """send_async_message can be awaited on an event loop other than the client's."""
+        result = asyncio.run(asyncio.wait_for(self.client.send_async_message("async"), timeout=5))
+
+        assert result is True
+        assert self.sent == ["async"]
+
+
+class TestTelegramNotifier:
+    """Tests for the TelegramNotifier shim."""
+
+    def test_instances_share_one_client(self):
+        """Every TelegramNotifier sends through the client returned by get_notifier."""
+        with patch("telegram_notifier.get_notifier") as mock_get_notifier:
+            TelegramNotifier().send_message("one")
+            TelegramNotifier().send_photo(b"png", caption="two")
+
+        client = mock_get_notifier.return_value
+        client.send_message.assert_called_once_with("one")
+        client.send_photo.assert_called_once_with(b"png", "two")
+
+    def test_spec_exposes_send_methods(self):
+        """Mocks specced from TelegramNotifier have the notifier's send methods."""
+        notifier = Mock(spec=TelegramNotifier)
+
+        for name in ("send_message", "send_photo", "send_async_message", "send_async_photo"):
+            assert callable(getattr(notifier, name))